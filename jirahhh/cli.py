@@ -4,14 +4,49 @@ Main CLI entrypoint for jirahhh with subcommands.
 """
 
 import argparse
+import functools
 import json
 import logging
 import os
 import signal
 import sys
 
-# Handle broken pipe gracefully (e.g., when piped to head/grep)
-signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+from . import __version__
+
+
+# Level names accepted in JIRAHHH_LOG_LEVEL
+_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+class _LazyStreamHandler(logging.StreamHandler):
+    """StreamHandler that switches its stream to line buffering on first emit.
+
+    Runs that never log anything (the usual case at WARNING level) skip
+    reconfiguring stderr altogether.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self._configured = False
+
+    def emit(self, record):
+        if not self._configured:
+            self._configured = True
+            # Force unbuffered output so logs appear immediately when run as
+            # subprocess; replaced streams (e.g. StringIO) may not support it
+            reconfigure = getattr(self.stream, "reconfigure", None)
+            if reconfigure is not None:
+                try:
+                    reconfigure(line_buffering=True)
+                except Exception:
+                    self.handleError(record)
+        super().emit(record)
 
 
 def configure_logging(verbose: bool = False):
@@ -23,89 +58,162 @@ def configure_logging(verbose: bool = False):
     """
     env_level = os.environ.get("JIRAHHH_LOG_LEVEL")
     if env_level:
-        level = getattr(logging, env_level.upper(), logging.WARNING)
+        level = _LEVELS.get(env_level.upper(), logging.WARNING)
     else:
         level = logging.DEBUG if verbose else logging.WARNING
 
-    # Force unbuffered output so logs appear immediately when run as subprocess
-    handler = logging.StreamHandler()
-    handler.setFormatter(logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    # Nothing here logs thread or process details; skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%H:%M:%S",
-    ))
-    handler.stream.reconfigure(line_buffering=True)
-    logging.root.addHandler(handler)
-    logging.root.setLevel(level)
-
-from .client import (
-    get_jira_client,
-    load_config,
-    get_api_token,
-    get_jira_url,
-    get_proxy_url,
-    get_email,
-    get_custom_fields,
-    get_security_level,
-)
-from .convert import read_description, convert_to_jira
-from .issues import (
-    create_issue,
-    update_issue,
-    view_issue,
-    search_issues,
-    get_fields,
-    add_comment,
-    call_api,
-)
+        handlers=[_LazyStreamHandler()],
+        force=True,
+    )
 
 
-def cmd_create(args):
-    """Handle the 'create' subcommand."""
-    # Get description from various sources
-    try:
-        description = read_description(
-            inline=args.description, file_path=args.description_file
-        )
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+def _die(message: str):
+    """Print an error message to stderr and exit with status 1."""
+    print(message, file=sys.stderr)
+    sys.exit(1)
 
-    # Convert acceptance criteria if provided
-    acceptance_criteria = None
-    if args.acceptance_criteria:
+
+def _handle_value_errors(func):
+    """Decorate a subcommand handler so any ValueError exits with 'Error: ...'.
+
+    Config, credential and input helpers report bad input as ValueError;
+    this turns those into the CLI's standard error message.
+    """
+
+    @functools.wraps(func)
+    def wrapper(args):
         try:
-            acceptance_criteria = convert_to_jira(args.acceptance_criteria)
+            return func(args)
         except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+            _die(f"Error: {e}")
 
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
+    return wrapper
 
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+def _emit(result):
+    """Write a command's result to stdout as JSON.
 
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
+    Output is indented when stdout is a terminal and compact when it is piped
+    or redirected (e.g. into jq or a file). Uses orjson when it is installed,
+    which is much faster for large search results. Otherwise compact output
+    is built with json.dumps, which uses the C encoder (json.dump never
+    does); indented output gets no C encoder either way, so it is streamed
+    to stdout with json.dump instead of built as one string first.
+    """
+    from .jsonutil import orjson
+
+    pretty = sys.stdout.isatty()
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # orjson produces UTF-8 bytes; write them to the binary stream
+        # directly, since stdout's own encoding may not be able to represent
+        # them (e.g. cp1252 on Windows)
+        option = orjson.OPT_APPEND_NEWLINE
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(result, option=option))
+        buffer.flush()
+        return
+
+    # The stdlib encoder escapes non-ASCII, so any stdout encoding works
+    if pretty:
+        json.dump(result, sys.stdout, indent=2)
+    else:
+        sys.stdout.write(json.dumps(result, separators=(",", ":")))
+    sys.stdout.write("\n")
+
+
+def _build_jira(args, config: dict):
+    """
+    Resolve credentials and connection settings, then build a Jira client.
+
+    JIRA_API_TOKEN (or JIRA_API_TOKEN_COMMAND), JIRA_URL and JIRA_EMAIL take
+    precedence over the config file; --url and --proxy take precedence over
+    both.
+
+    Args:
+        args: Parsed command line arguments (uses env, url and proxy)
+        config: Configuration dictionary from load_config()
+
+    Returns:
+        JIRA client instance
+
+    Raises:
+        ValueError: If the token or URL cannot be found, or a token command fails
+    """
+    from .client import (
+        get_jira_client,
+        get_api_token,
+        get_jira_url,
+        get_proxy_url,
+        get_email,
     )
 
-    # Get Jira client
+    # Get API token and Jira URL (--url overrides both env var and config)
+    api_token = get_api_token(args.env, config)
+    jira_url = args.url if args.url else get_jira_url(args.env, config)
+
+    # Get proxy URL from config (can be overridden by --proxy)
+    proxy_url = args.proxy if args.proxy else get_proxy_url(args.env, config)
+
+    # A token command (JIRA_API_TOKEN_COMMAND) only runs here, once every
+    # local input has been validated
     email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    return get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+
+
+def _names_file(value) -> bool:
+    """Whether a --description style argument is the path of an existing file."""
+    return bool(value) and "\n" not in value and os.path.isfile(value)
+
+
+@_handle_value_errors
+def cmd_create(args):
+    """Handle the 'create' subcommand."""
+    from .client import load_config, get_custom_fields, get_security_level
+    from .convert import read_description, convert_to_jira
+    from .issues import create_issue
+
+    # Get description from various sources, and convert acceptance criteria
+    # if provided. Either can be a markdown file needing its own pandoc run,
+    # so when both are files they are read and converted concurrently.
+    acceptance_criteria = None
+    description_is_file = (
+        args.description_file not in (None, "-")
+        or _names_file(args.description)
+    )
+    if description_is_file and _names_file(args.acceptance_criteria):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            description_future = executor.submit(
+                read_description,
+                inline=args.description,
+                file_path=args.description_file,
+            )
+            criteria_future = executor.submit(convert_to_jira, args.acceptance_criteria)
+            description = description_future.result()
+            acceptance_criteria = criteria_future.result()
+    else:
+        description = read_description(
+            inline=args.description, file_path=args.description_file
+        )
+        if args.acceptance_criteria:
+            acceptance_criteria = convert_to_jira(args.acceptance_criteria)
+
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Get custom field IDs and security level from config
     custom_field_ids = get_custom_fields(args.env, config)
@@ -126,61 +234,36 @@ def cmd_create(args):
             custom_field_ids=custom_field_ids,
             security_level_id=security_level_id,
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error creating issue: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error creating issue: {e}")
 
 
+@_handle_value_errors
 def cmd_update(args):
     """Handle the 'update' subcommand."""
+    from .client import load_config, get_custom_fields
+    from .issues import update_issue
+
     # Get description from various sources if any were provided
     description = None
     if args.description or args.description_file:
-        try:
-            description = read_description(
-                inline=args.description, file_path=args.description_file
-            )
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
+        from .convert import read_description
+
+        description = read_description(
+            inline=args.description, file_path=args.description_file
+        )
 
     # Convert acceptance criteria if provided
     acceptance_criteria = None
     if args.acceptance_criteria:
-        try:
-            acceptance_criteria = convert_to_jira(args.acceptance_criteria)
-        except ValueError as e:
-            print(f"Error: {e}", file=sys.stderr)
-            sys.exit(1)
-
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
-
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        from .convert import convert_to_jira
 
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
+        acceptance_criteria = convert_to_jira(args.acceptance_criteria)
 
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Get custom field IDs from config
     custom_field_ids = get_custom_fields(args.env, config)
@@ -195,41 +278,20 @@ def cmd_update(args):
             acceptance_criteria=acceptance_criteria,
             custom_field_ids=custom_field_ids,
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error updating issue: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error updating issue: {e}")
 
 
+@_handle_value_errors
 def cmd_view(args):
     """Handle the 'view' subcommand."""
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
-
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .client import load_config, get_custom_fields
+    from .issues import view_issue
 
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
-
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Get custom field IDs from config
     custom_field_ids = get_custom_fields(args.env, config)
@@ -242,128 +304,62 @@ def cmd_view(args):
             fields=args.fields,
             custom_field_ids=custom_field_ids,
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error viewing issue: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error viewing issue: {e}")
 
 
+@_handle_value_errors
 def cmd_search(args):
     """Handle the 'search' subcommand."""
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
-
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .client import load_config
+    from .issues import search_issues
 
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
-
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Search for issues
     try:
         result = search_issues(
             jira=jira, jql=args.jql, fields=args.fields, max_results=args.max_results
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error searching issues: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error searching issues: {e}")
 
 
+@_handle_value_errors
 def cmd_fields(args):
     """Handle the 'fields' subcommand."""
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
+    from .client import load_config
+    from .issues import get_fields
 
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
-
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Get fields
     try:
         result = get_fields(jira=jira, project_key=args.project, issue_type=args.type)
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error getting fields: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error getting fields: {e}")
 
 
+@_handle_value_errors
 def cmd_comment(args):
     """Handle the 'comment' subcommand."""
-    # Get comment body from various sources
-    try:
-        body = read_description(inline=args.body, file_path=args.body_file)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+    from .client import load_config
+    from .convert import read_description
+    from .issues import add_comment
 
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
-
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
+    # Get comment body from various sources
+    body = read_description(inline=args.body, file_path=args.body_file)
 
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Add the comment
     try:
@@ -372,288 +368,292 @@ def cmd_comment(args):
             issue_key=args.issue_key,
             body=body,
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error adding comment: {e}", file=sys.stderr)
-        sys.exit(1)
+        _die(f"Error adding comment: {e}")
 
 
+@_handle_value_errors
 def cmd_api(args):
     """Handle the 'api' subcommand."""
-    # Load configuration
-    config = load_config(args.config if hasattr(args, 'config') else None)
-
-    # Get API token
-    try:
-        api_token = get_api_token(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get Jira URL from config (can be overridden by --url)
-    try:
-        jira_url = args.url if args.url else get_jira_url(args.env, config)
-    except ValueError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    # Get proxy URL from config (can be overridden by --proxy)
-    proxy_url = (
-        args.proxy
-        if hasattr(args, "proxy") and args.proxy
-        else get_proxy_url(args.env, config)
-    )
-
-    # Get Jira client
-    email = get_email(args.env, config)
-    jira = get_jira_client(jira_url, api_token, proxy_url, config, email=email)
+    from .client import load_config
+    from .issues import call_api
 
     # Parse JSON data if provided
     data = None
     if args.data:
+        from .jsonutil import loads
+
         try:
-            data = json.loads(args.data)
-        except json.JSONDecodeError as e:
-            print(f"Error parsing JSON data: {e}", file=sys.stderr)
-            sys.exit(1)
+            data = loads(args.data)
+        except ValueError as e:
+            # json.JSONDecodeError and orjson.JSONDecodeError are both ValueErrors
+            _die(f"Error parsing JSON data: {e}")
 
     # Handle --body-file: read file, convert if .md, inject into data["body"]
-    if hasattr(args, "body_file") and args.body_file:
+    if args.body_file:
+        from .convert import read_description
+
         try:
             body_content = read_description(file_path=args.body_file)
             if data is None:
                 data = {}
             data["body"] = body_content
         except ValueError as e:
-            print(f"Error reading body file: {e}", file=sys.stderr)
-            sys.exit(1)
+            _die(f"Error reading body file: {e}")
+
+    # Load configuration and build the Jira client
+    config = load_config(args.config)
+    jira = _build_jira(args, config)
 
     # Make API call
     try:
         result = call_api(
             jira=jira, method=args.method, endpoint=args.endpoint, data=data
         )
-        print(json.dumps(result, indent=2))
+        _emit(result)
     except Exception as e:
-        print(f"Error making API call: {e}", file=sys.stderr)
-        sys.exit(1)
-
-
-def main():
-    parser = argparse.ArgumentParser(
-        prog="jirahhh",
-        description="Manage Jira issues with proper wiki markup formatting",
-    )
-
-    # Global options
-    parser.add_argument(
-        "-v", "--verbose",
-        action="store_true",
-        help="Enable debug logging",
-    )
-    parser.add_argument(
-        "--config",
-        help="Path to config file (default: ~/.config/jirahhh/config.yaml or .jira-config.yaml)",
+        _die(f"Error making API call: {e}")
+
+
+# Subcommand name -> handler
+_DISPATCH = {
+    "create": cmd_create,
+    "update": cmd_update,
+    "view": cmd_view,
+    "search": cmd_search,
+    "fields": cmd_fields,
+    "comment": cmd_comment,
+    "api": cmd_api,
+}
+
+
+def _build_common_parser():
+    """Build the parent parser for options shared by every subcommand."""
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--url", help="Jira URL (overrides config file)")
+    common.add_argument("--proxy", help="HTTP/HTTPS proxy URL (overrides config file)")
+    common.add_argument(
+        "--env",
+        required=True,
+        help="Environment name from config file (e.g., staging, production)",
     )
+    return common
 
-    subparsers = parser.add_subparsers(dest="command", help="Subcommands")
-    subparsers.required = True
 
-    # Create subcommand
-    create_parser = subparsers.add_parser(
-        "create",
-        help="Create a new Jira issue",
-        epilog="Description can be provided via --description (inline text or file path) or --description-file",
-    )
-    create_parser.add_argument(
-        "--project", required=True, help="Project key (e.g., PROJ)"
-    )
-    create_parser.add_argument("--summary", required=True, help="Issue summary/title")
-    create_parser.add_argument(
+def _add_create_arguments(parser):
+    """Add arguments for the 'create' subcommand."""
+    parser.add_argument("--project", required=True, help="Project key (e.g., PROJ)")
+    parser.add_argument("--summary", required=True, help="Issue summary/title")
+    parser.add_argument(
         "--type", required=True, help="Issue type (e.g., Epic, Story, Task, Spike)"
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--description",
         help="Issue description: inline Jira wiki markup, or path to file (.md auto-converts, .txt as-is)",
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--description-file",
         help="File containing description in Jira wiki markup (use - for stdin)",
     )
-    create_parser.add_argument(
+    parser.add_argument(
         "--acceptance-criteria", help="Acceptance criteria (inline text or file path)"
     )
-    create_parser.add_argument(
-        "--epic-name", help="Epic name (required for Epic issue type)"
-    )
-    create_parser.add_argument("--parent", help="Parent issue key (e.g., PROJ-123)")
-    create_parser.add_argument("--epic-link", help="Epic link (e.g., PROJ-456)")
-    create_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    create_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    create_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
-    )
-    create_parser.set_defaults(func=cmd_create)
+    parser.add_argument("--epic-name", help="Epic name (required for Epic issue type)")
+    parser.add_argument("--parent", help="Parent issue key (e.g., PROJ-123)")
+    parser.add_argument("--epic-link", help="Epic link (e.g., PROJ-456)")
 
-    # Update subcommand
-    update_parser = subparsers.add_parser(
-        "update",
-        help="Update an existing Jira issue",
-        epilog="Description can be provided via --description (inline text or file path) or --description-file",
-    )
-    update_parser.add_argument("issue_key", help="Issue key to update (e.g., PROJ-123)")
-    update_parser.add_argument("--summary", help="New issue summary/title")
-    update_parser.add_argument(
+
+def _add_update_arguments(parser):
+    """Add arguments for the 'update' subcommand."""
+    parser.add_argument("issue_key", help="Issue key to update (e.g., PROJ-123)")
+    parser.add_argument("--summary", help="New issue summary/title")
+    parser.add_argument(
         "--description",
         help="New description: inline Jira wiki markup, or path to file (.md auto-converts, .txt as-is)",
     )
-    update_parser.add_argument(
+    parser.add_argument(
         "--description-file",
         help="File containing description in Jira wiki markup (use - for stdin)",
     )
-    update_parser.add_argument(
+    parser.add_argument(
         "--acceptance-criteria",
         help="New acceptance criteria (inline text or file path)",
     )
-    update_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    update_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    update_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
-    )
-    update_parser.set_defaults(func=cmd_update)
 
-    # View subcommand
-    view_parser = subparsers.add_parser(
-        "view", help="View a Jira issue with all details"
-    )
-    view_parser.add_argument("issue_key", help="Issue key to view (e.g., PROJ-123)")
-    view_parser.add_argument(
+
+def _add_view_arguments(parser):
+    """Add arguments for the 'view' subcommand."""
+    parser.add_argument("issue_key", help="Issue key to view (e.g., PROJ-123)")
+    parser.add_argument(
         "--fields",
-        help="Comma-separated list of fields to retrieve (default: all common fields)",
-    )
-    view_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    view_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    view_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
+        help="Comma-separated list of fields to retrieve (default: the fields shown in the output)",
     )
-    view_parser.set_defaults(func=cmd_view)
 
-    # Search subcommand
-    search_parser = subparsers.add_parser(
-        "search", help="Search for Jira issues using JQL"
-    )
-    search_parser.add_argument(
+
+def _add_search_arguments(parser):
+    """Add arguments for the 'search' subcommand."""
+    parser.add_argument(
         "jql", help='JQL query string (e.g., "project = PROJ AND status = Open")'
     )
-    search_parser.add_argument(
+    parser.add_argument(
         "--fields",
         help="Comma-separated list of fields to retrieve (default: summary,status,issuetype,assignee)",
     )
-    search_parser.add_argument(
+    parser.add_argument(
         "--max-results",
         type=int,
         default=50,
         help="Maximum number of results to return (default: 50)",
     )
-    search_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    search_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    search_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
-    )
-    search_parser.set_defaults(func=cmd_search)
 
-    # Fields subcommand
-    fields_parser = subparsers.add_parser(
-        "fields", help="List available fields for a project/issue type"
-    )
-    fields_parser.add_argument(
-        "--project", help="Project key to filter fields (e.g., PROJ)"
-    )
-    fields_parser.add_argument(
-        "--type", help="Issue type to filter fields (e.g., Epic)"
-    )
-    fields_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    fields_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    fields_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
-    )
-    fields_parser.set_defaults(func=cmd_fields)
 
-    # Comment subcommand
-    comment_parser = subparsers.add_parser(
-        "comment",
-        help="Add a comment to a Jira issue",
-        epilog="Comment body can be provided via --body (inline text or file path) or --body-file",
-    )
-    comment_parser.add_argument(
-        "issue_key", help="Issue key to comment on (e.g., PROJ-123)"
-    )
-    comment_parser.add_argument(
+def _add_fields_arguments(parser):
+    """Add arguments for the 'fields' subcommand."""
+    parser.add_argument("--project", help="Project key to filter fields (e.g., PROJ)")
+    parser.add_argument("--type", help="Issue type to filter fields (e.g., Epic)")
+
+
+def _add_comment_arguments(parser):
+    """Add arguments for the 'comment' subcommand."""
+    parser.add_argument("issue_key", help="Issue key to comment on (e.g., PROJ-123)")
+    parser.add_argument(
         "--body",
         help="Comment body: inline Jira wiki markup, or path to file (.md auto-converts, .txt as-is)",
     )
-    comment_parser.add_argument(
+    parser.add_argument(
         "--body-file",
         help="File containing comment body in Jira wiki markup (use - for stdin)",
     )
-    comment_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    comment_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
-    )
-    comment_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
-    )
-    comment_parser.set_defaults(func=cmd_comment)
 
-    # API subcommand
-    api_parser = subparsers.add_parser("api", help="Make a generic API call to Jira")
-    api_parser.add_argument(
+
+def _add_api_arguments(parser):
+    """Add arguments for the 'api' subcommand."""
+    parser.add_argument(
         "method", choices=["GET", "POST", "PUT", "DELETE"], help="HTTP method"
     )
-    api_parser.add_argument(
+    parser.add_argument(
         "endpoint", help="API endpoint path (e.g., /rest/api/2/issue/PROJ-123/comment)"
     )
-    api_parser.add_argument("--data", help="JSON data for POST/PUT requests")
-    api_parser.add_argument(
+    parser.add_argument("--data", help="JSON data for POST/PUT requests")
+    parser.add_argument(
         "--body-file",
         help="File containing body content (.md auto-converts to Jira wiki markup). Injects into --data under 'body' key.",
     )
-    api_parser.add_argument("--url", help="Jira URL (overrides config file)")
-    api_parser.add_argument(
-        "--proxy", help="HTTP/HTTPS proxy URL (overrides config file)"
+
+
+# Subcommand name -> (argument builder, add_parser() keyword arguments)
+_SUBCOMMANDS = {
+    "create": (
+        _add_create_arguments,
+        {
+            "help": "Create a new Jira issue",
+            "epilog": "Description can be provided via --description (inline text or file path) or --description-file",
+        },
+    ),
+    "update": (
+        _add_update_arguments,
+        {
+            "help": "Update an existing Jira issue",
+            "epilog": "Description can be provided via --description (inline text or file path) or --description-file",
+        },
+    ),
+    "view": (_add_view_arguments, {"help": "View a Jira issue with all details"}),
+    "search": (_add_search_arguments, {"help": "Search for Jira issues using JQL"}),
+    "fields": (
+        _add_fields_arguments,
+        {"help": "List available fields for a project/issue type"},
+    ),
+    "comment": (
+        _add_comment_arguments,
+        {
+            "help": "Add a comment to a Jira issue",
+            "epilog": "Comment body can be provided via --body (inline text or file path) or --body-file",
+        },
+    ),
+    "api": (_add_api_arguments, {"help": "Make a generic API call to Jira"}),
+}
+
+
+def _find_command(argv):
+    """
+    Find the subcommand named on the command line without parsing it.
+
+    Only the global options (-v/--verbose, --config PATH) may come before the
+    subcommand, so the first bare token naming a known subcommand is the one
+    being invoked.
+
+    Args:
+        argv: Command line arguments, excluding the program name
+
+    Returns:
+        Subcommand name, or None if no known subcommand is present
+    """
+    skip_next = False
+    for arg in argv:
+        if skip_next:
+            skip_next = False
+        elif len(arg) > 2 and "--config".startswith(arg):
+            # --config (or an abbreviation of it) consumes the next token
+            skip_next = True
+        elif arg in _SUBCOMMANDS:
+            return arg
+    return None
+
+
+def main():
+    # Answer a bare --version before building any parsers
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"jirahhh {__version__}")
+        return
+
+    parser = argparse.ArgumentParser(
+        prog="jirahhh",
+        description="Manage Jira issues with proper wiki markup formatting",
     )
-    api_parser.add_argument(
-        "--env",
-        required=True,
-        help="Environment name from config file (e.g., staging, production)",
+
+    # Global options
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Enable debug logging",
+    )
+    parser.add_argument(
+        "-V", "--version",
+        action="version",
+        version=f"%(prog)s {__version__}",
+    )
+    parser.add_argument(
+        "--config",
+        help="Path to config file (default: ~/.config/jirahhh/config.yaml or .jira-config.yaml)",
     )
-    api_parser.set_defaults(func=cmd_api)
+
+    subparsers = parser.add_subparsers(dest="command", help="Subcommands")
+    subparsers.required = True
+
+    # Every subcommand is registered so help and "invalid choice" errors list
+    # them all, but only the one being invoked gets its arguments built. With
+    # no subcommand on the command line (--help, or a usage error) none are:
+    # top-level help only shows each subcommand's name and help string.
+    command = _find_command(sys.argv[1:])
+    for name, (add_arguments, parser_kwargs) in _SUBCOMMANDS.items():
+        if name == command:
+            subparser = subparsers.add_parser(
+                name, parents=[_build_common_parser()], **parser_kwargs
+            )
+            add_arguments(subparser)
+        else:
+            subparsers.add_parser(name, **parser_kwargs)
 
     args = parser.parse_args()
     configure_logging(verbose=args.verbose)
-    args.func(args)
+
+    # Handle broken pipe gracefully (e.g., when piped to head/grep).
+    # SIGPIPE doesn't exist on Windows.
+    if hasattr(signal, "SIGPIPE"):
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+
+    _DISPATCH[args.command](args)
 
 
 if __name__ == "__main__":
@@ -2,30 +2,40 @@
 Core Jira client functionality.
 """
 
+import functools
+import hashlib
+import json
 import logging
 import os
 import socket
+import tempfile
 import time
 from pathlib import Path
-from jira import JIRA
-import yaml
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from jira import JIRA
 
 logger = logging.getLogger(__name__)
 
-# IPv4-only mode to avoid slow IPv6 connection attempts
-# Python tries IPv6 first sequentially, unlike browsers which use Happy Eyeballs
-_original_getaddrinfo = socket.getaddrinfo
+# IPv4-only mode to avoid slow IPv6 connection attempts. Happy Eyeballs
+# (below) already handles broken IPv6 routes; this remains for networks
+# where IPv6 should never be used at all
 _ipv4_only_enabled = False
 
 
-def _ipv4_only_getaddrinfo(*args, **kwargs):
-    """Filter getaddrinfo results to IPv4 only."""
-    results = _original_getaddrinfo(*args, **kwargs)
-    return [r for r in results if r[0] == socket.AF_INET]
+def _ipv4_gai_family():
+    """Address family for urllib3 to resolve: IPv4 only."""
+    return socket.AF_INET
 
 
 def enable_ipv4_only():
-    """Force all socket connections to use IPv4 only.
+    """Force HTTP connections made through urllib3 (requests, jira) to use IPv4 only.
+
+    urllib3 asks allowed_gai_family() which address family to pass to
+    getaddrinfo, so pinning it to AF_INET means AAAA records are never even
+    looked up. socket.getaddrinfo itself is left alone for the rest of the
+    process.
 
     Can be enabled via:
     - Environment variable: JIRAHHH_IPV4_ONLY=1
@@ -33,11 +43,28 @@ def enable_ipv4_only():
     """
     global _ipv4_only_enabled
     if not _ipv4_only_enabled:
-        socket.getaddrinfo = _ipv4_only_getaddrinfo
+        import urllib3.util.connection
+
+        urllib3.util.connection.allowed_gai_family = _ipv4_gai_family
         _ipv4_only_enabled = True
         logger.debug("Forcing IPv4-only connections")
 
 
+@functools.lru_cache(maxsize=None)
+def _ipv4_only_env():
+    """Read JIRAHHH_IPV4_ONLY once.
+
+    Returns:
+        True or False if the variable is set to a recognized value, else None
+    """
+    env_val = os.environ.get("JIRAHHH_IPV4_ONLY", "").lower()
+    if env_val in ("1", "true", "yes"):
+        return True
+    if env_val in ("0", "false", "no"):
+        return False
+    return None
+
+
 def should_use_ipv4_only(config: dict = None) -> bool:
     """Check if IPv4-only mode should be enabled.
 
@@ -49,37 +76,202 @@ def should_use_ipv4_only(config: dict = None) -> bool:
         True if IPv4-only mode should be enabled
     """
     # Check environment variable first
-    env_val = os.environ.get("JIRAHHH_IPV4_ONLY", "").lower()
+    env_setting = _ipv4_only_env()
+    if env_setting is not None:
+        return env_setting
+
+    # Check config file
+    if config and config.get("ipv4_only"):
+        return True
+
+    return False
+
+
+# Happy Eyeballs (RFC 8305): race connection attempts across the resolved
+# addresses instead of trying them one at a time, IPv6 first
+_happy_eyeballs_enabled = False
+
+
+def enable_happy_eyeballs():
+    """Make HTTP connections made through urllib3 (requests, jira) race addresses.
+
+    urllib3 looks up create_connection on its util.connection module at
+    connect time, so replacing it there is enough. This affects every urllib3
+    connection in the process, so it is off by default. Address families
+    still come from allowed_gai_family(), so IPv4-only mode keeps working.
+
+    Can be enabled via:
+    - Environment variable: JIRAHHH_HAPPY_EYEBALLS=1
+    - Config file: happy_eyeballs: true (at top level)
+    """
+    global _happy_eyeballs_enabled
+    if not _happy_eyeballs_enabled:
+        import urllib3.util.connection
+
+        from .happy_eyeballs import create_connection
+
+        urllib3.util.connection.create_connection = create_connection
+        _happy_eyeballs_enabled = True
+        logger.debug("Racing connection attempts (Happy Eyeballs)")
+
+
+def should_use_happy_eyeballs(config: dict = None) -> bool:
+    """Check if Happy Eyeballs connection racing should be enabled.
+
+    Checks (in order):
+    1. JIRAHHH_HAPPY_EYEBALLS environment variable (1/true/yes)
+    2. happy_eyeballs in config file
+
+    Returns:
+        True if Happy Eyeballs should be enabled
+    """
+    env_val = os.environ.get("JIRAHHH_HAPPY_EYEBALLS", "").lower()
     if env_val in ("1", "true", "yes"):
         return True
     if env_val in ("0", "false", "no"):
         return False
 
-    # Check config file
-    if config and config.get("ipv4_only"):
+    if config and config.get("happy_eyeballs"):
+        return True
+
+    return False
+
+
+def enable_dns_cache():
+    """Cache DNS lookups for HTTP connections made through urllib3 (requests, jira).
+
+    Lookups are kept for 5 minutes, so new pooled and parallel connections
+    to the Jira host skip the resolver. Like Happy Eyeballs this hooks
+    urllib3 for the whole process, so it is off by default. It works on its
+    own or together with Happy Eyeballs and IPv4-only mode.
+
+    Can be enabled via:
+    - Environment variable: JIRAHHH_DNS_CACHE=1
+    - Config file: dns_cache: true (at top level)
+    """
+    from . import dns_cache
+
+    dns_cache.enable()
+
+
+def should_use_dns_cache(config: dict = None) -> bool:
+    """Check if DNS lookups should be cached.
+
+    Checks (in order):
+    1. JIRAHHH_DNS_CACHE environment variable (1/true/yes)
+    2. dns_cache in config file
+
+    Returns:
+        True if the DNS cache should be enabled
+    """
+    env_val = os.environ.get("JIRAHHH_DNS_CACHE", "").lower()
+    if env_val in ("1", "true", "yes"):
+        return True
+    if env_val in ("0", "false", "no"):
+        return False
+
+    if config and config.get("dns_cache"):
         return True
 
     return False
 
 
+def get_max_concurrent_requests() -> int:
+    """
+    Get the maximum number of Jira requests to have in flight at once.
+
+    Set via JIRAHHH_MAX_CONCURRENT_REQUESTS (default 3). Kept low so parallel
+    fetches don't trip Jira's rate limiting.
+
+    Returns:
+        Positive number of concurrent requests
+
+    Raises:
+        ValueError: If the environment variable is not a positive integer
+    """
+    value = os.getenv("JIRAHHH_MAX_CONCURRENT_REQUESTS", "3")
+    try:
+        max_requests = int(value)
+    except ValueError:
+        max_requests = 0
+    if max_requests < 1:
+        raise ValueError(
+            f"JIRAHHH_MAX_CONCURRENT_REQUESTS must be a positive integer, got {value!r}"
+        )
+    return max_requests
+
+
+# Jira clients reused within a process, keyed on connection settings:
+# (url, token fingerprint, proxy, email) -> (created monotonic time, client)
+_client_cache = {}
+_CLIENT_CACHE_TTL = 8 * 60 * 60
+
+
+# Connection pool sizing for the client's HTTP adapter. requests defaults to
+# 10 pooled connections per host; concurrent callers need more headroom so
+# connections are reused instead of being opened and discarded.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+
+def _mount_pool_adapter(session):
+    """Mount an HTTPAdapter with a larger connection pool on a requests session.
+
+    The per-host pool is never smaller than JIRAHHH_MAX_CONCURRENT_REQUESTS,
+    so parallel fetches don't open connections the pool then has to discard.
+    An invalid value is ignored here; it is reported by the commands that
+    actually make parallel requests. Retries are left to jira's
+    ResilientSession, which already retries 429 and 5xx responses with
+    backoff.
+    """
+    from requests.adapters import HTTPAdapter
+
+    try:
+        pool_maxsize = max(_POOL_MAXSIZE, get_max_concurrent_requests())
+    except ValueError:
+        pool_maxsize = _POOL_MAXSIZE
+    adapter = HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+def _token_fingerprint(api_token: str) -> str:
+    """Hash a token for use as a cache key, so the key doesn't hold the secret."""
+    return hashlib.blake2b(api_token.encode(), digest_size=16).hexdigest()
+
+
 def get_jira_client(
     jira_url: str, api_token: str, proxy_url: str = None, config: dict = None,
     email: str = None,
-) -> JIRA:
+) -> "JIRA":
     """
     Create and return a Jira client instance.
 
+    Clients are cached for the life of the process (up to 8 hours), so
+    repeated calls with the same URL, token, proxy and email return the
+    same instance and its open connections.
+
     Args:
         jira_url: The Jira instance URL
-        api_token: The Jira API token
+        api_token: The Jira API token (or a DeferredToken, resolved here)
         proxy_url: Optional HTTP/HTTPS proxy URL (e.g., 'http://proxy.example.com:3128')
                    Can also be set via HTTPS_PROXY or HTTP_PROXY environment variables
-        config: Optional config dict for additional settings like ipv4_only
+        config: Optional config dict for additional settings like ipv4_only,
+                happy_eyeballs and dns_cache
         email: Optional email for basic auth (required for Jira Cloud)
 
     Returns:
         JIRA client instance
+
+    Raises:
+        ValueError: If a deferred token command fails
     """
+    from jira import JIRA
+
+    # Run the token command now, if there is one; this is the first point
+    # where the token is actually needed
+    api_token = str(api_token)
+
     proxies = None
     if proxy_url:
         proxies = {"http": proxy_url, "https": proxy_url}
@@ -92,23 +284,196 @@ def get_jira_client(
     # Check if IPv4-only mode should be enabled
     if should_use_ipv4_only(config):
         enable_ipv4_only()
+    if should_use_happy_eyeballs(config):
+        enable_happy_eyeballs()
+    if should_use_dns_cache(config):
+        enable_dns_cache()
+
+    # Reuse a client built earlier in this process with the same settings
+    cache_key = (
+        jira_url,
+        _token_fingerprint(api_token),
+        proxies["https"] if proxies else None,
+        email,
+    )
+    cached = _client_cache.get(cache_key)
+    if cached and time.monotonic() - cached[0] < _CLIENT_CACHE_TTL:
+        logger.debug("Reusing JIRA client for %s", jira_url)
+        return cached[1]
 
     # Use basic auth (email + API token) for Jira Cloud, bearer token for Data Center
     if email:
         auth_kwargs = {"basic_auth": (email, api_token)}
-        auth_desc = f"basic auth ({email})"
     else:
         auth_kwargs = {"token_auth": api_token}
-        auth_desc = "bearer token"
 
-    logger.debug("Creating JIRA client for %s (proxy: %s, auth: %s)", jira_url, proxy_url or "none", auth_desc)
-    start = time.time()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        auth_desc = f"basic auth ({email})" if email else "bearer token"
+        logger.debug("Creating JIRA client for %s (proxy: %s, auth: %s)", jira_url, proxy_url or "none", auth_desc)
+        start = time.time()
+
     client = JIRA(options=jira_options, proxies=proxies, **auth_kwargs)
-    elapsed = time.time() - start
-    logger.debug("JIRA client created in %.2fs", elapsed)
+    _mount_pool_adapter(client._session)
+
+    if debug:
+        logger.debug("JIRA client created in %.2fs", time.time() - start)
+    _client_cache[cache_key] = (time.monotonic(), client)
     return client
 
 
+def close_all_clients():
+    """Close every cached Jira client's connections and empty the client cache."""
+    for _created, client in _client_cache.values():
+        client.close()
+    _client_cache.clear()
+
+
+# Parsed config files: resolved path -> (mtime_ns, config)
+_config_cache = {}
+
+
+def _cache_dir() -> Path:
+    """jirahhh's cache directory, under $XDG_CACHE_HOME or ~/.cache."""
+    # The XDG spec says to ignore relative paths
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache and os.path.isabs(xdg_cache):
+        return Path(xdg_cache) / "jirahhh"
+    return Path.home() / ".cache" / "jirahhh"
+
+
+def _parsed_config_path(resolved: str) -> Path:
+    """Location of the on-disk parsed copy of a YAML config file."""
+    digest = hashlib.blake2b(resolved.encode(), digest_size=16).hexdigest()
+    return _cache_dir() / f"config-{digest}.json"
+
+
+def _prune_parsed_configs(keep: Path):
+    """Delete parsed copies whose YAML config has been moved or deleted.
+
+    Args:
+        keep: Parsed copy just written, which is left alone
+    """
+    for path in keep.parent.glob("config-*.json"):
+        if path == keep:
+            continue
+        try:
+            with open(path, "r") as f:
+                source = json.load(f).get("source")
+            if source and os.path.exists(source):
+                continue
+            path.unlink()
+        except (OSError, ValueError, AttributeError) as e:
+            logger.debug("Could not prune parsed config %s: %s", path, e)
+
+
+def _load_parsed_config(resolved: str, stat: os.stat_result):
+    """
+    Load the parsed copy of a YAML config saved by an earlier run.
+
+    Returns:
+        Configuration dictionary, or None if there is no copy or the YAML
+        file has changed since it was saved
+    """
+    try:
+        with open(_parsed_config_path(resolved), "r") as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(entry, dict)
+        or entry.get("mtime_ns") != stat.st_mtime_ns
+        or entry.get("size") != stat.st_size
+    ):
+        return None
+    return entry.get("config")
+
+
+def _save_parsed_config(resolved: str, stat: os.stat_result, config: dict):
+    """
+    Save a parsed YAML config as JSON so later runs can skip PyYAML.
+
+    The copy holds the same secrets as the config, so it is written with
+    owner-only permissions. Configs JSON can't represent faithfully (dates,
+    non-string keys) are not saved. Copies left behind by configs that no
+    longer exist are removed at the same time. Failures are logged and
+    ignored.
+    """
+    entry = {
+        "source": resolved,
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "config": config,
+    }
+    try:
+        payload = json.dumps(entry)
+    except (TypeError, ValueError):
+        return
+    if json.loads(payload)["config"] != config:
+        return
+
+    path = _parsed_config_path(resolved)
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # mkstemp creates the file with 0600 permissions
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not save parsed config to %s: %s", path, e)
+        return
+    _prune_parsed_configs(path)
+
+
+def _read_config(path: Path) -> dict:
+    """Parse a config file, reusing the cached result if it hasn't changed.
+
+    Files ending in .json are read with the json module; anything else is
+    YAML, parsed with libyaml's CSafeLoader when PyYAML was built with it.
+    Parsed YAML is also kept as JSON in the cache directory, so later runs
+    load that instead of parsing the YAML again until the file changes.
+    """
+    resolved = str(path.resolve())
+    stat = path.stat()
+    cached = _config_cache.get(resolved)
+    if cached and cached[0] == stat.st_mtime_ns:
+        return cached[1]
+
+    if path.suffix == ".json":
+        with open(path, "r") as f:
+            config = json.load(f)
+    else:
+        config = _load_parsed_config(resolved, stat)
+        if config is None:
+            import yaml
+
+            try:
+                from yaml import CSafeLoader as SafeLoader
+            except ImportError:
+                from yaml import SafeLoader
+            with open(path, "r") as f:
+                config = yaml.load(f, Loader=SafeLoader)
+            # An empty file parses as None, which would read back from the
+            # parsed copy as a miss; store it as an empty config instead
+            if config is None:
+                config = {}
+            _save_parsed_config(resolved, stat, config)
+
+    _config_cache[resolved] = (stat.st_mtime_ns, config)
+    return config
+
+
+def clear_config_cache():
+    """Forget all parsed config files, forcing the next load to re-read them."""
+    _config_cache.clear()
+
+
 def load_config(config_path: Path = None) -> dict:
     """
     Load configuration from config file.
@@ -118,6 +483,10 @@ def load_config(config_path: Path = None) -> dict:
     2. ~/.config/jirahhh/config.yaml
     3. .jira-config.yaml in current directory
 
+    Parsed files are cached by path and modification time, so repeated
+    calls only re-read the YAML when the file changes. Use
+    clear_config_cache() to drop the cache explicitly (e.g. in tests).
+
     Args:
         config_path: Optional explicit path to config file
 
@@ -128,8 +497,7 @@ def load_config(config_path: Path = None) -> dict:
         # Explicit path provided - use it
         config_path = Path(config_path)
         if config_path.exists():
-            with open(config_path, "r") as f:
-                return yaml.safe_load(f)
+            return _read_config(config_path)
         return {}
 
     # Check standard locations
@@ -140,36 +508,67 @@ def load_config(config_path: Path = None) -> dict:
 
     for location in locations:
         if location.exists():
-            with open(location, "r") as f:
-                return yaml.safe_load(f)
+            return _read_config(location)
 
     return {}
 
 
-def get_api_token(env: str, config: dict = None) -> str:
+def _env_section(env: str, config: dict) -> dict:
+    """
+    Get an environment's section of the config.
+
+    Returns:
+        The {env} mapping from the config, or {} if it is missing or empty
+        (an environment key with no settings under it parses as None)
+    """
+    return config.get(env) or {}
+
+
+def get_api_token(env: str, config: dict = None):
     """
     Get API token from environment variable or config file.
 
+    Checks (in order):
+    1. JIRA_API_TOKEN environment variable
+    2. JIRA_API_TOKEN_COMMAND environment variable (command that prints the token)
+    3. {env}.token in config file
+    4. {env}.token_command in config file
+
+    Token commands are not run here; a DeferredToken is returned instead and
+    the command runs when the Jira client is created. The command timeout
+    (default 30s) can be set via JIRAHHH_TOKEN_COMMAND_TIMEOUT.
+
     Args:
         env: Environment name (e.g., staging, production)
         config: Optional configuration dictionary
 
     Returns:
-        API token string
+        API token string, or a DeferredToken if a token command is configured
 
     Raises:
         ValueError: If token cannot be found
     """
     api_token = os.getenv("JIRA_API_TOKEN")
-    if not api_token and config:
-        api_token = config.get(env, {}).get("token")
-
-    if not api_token:
+    if api_token:
+        return api_token
+
+    token_command = os.getenv("JIRA_API_TOKEN_COMMAND")
+    if not token_command and config:
+        env_config = _env_section(env, config)
+        api_token = env_config.get("token")
+        if api_token:
+            return api_token
+        token_command = env_config.get("token_command")
+
+    if not token_command:
         raise ValueError(
             f"JIRA_API_TOKEN environment variable or {env}.token in .jira-config.yaml must be set"
         )
 
-    return api_token
+    from .credential_command import DeferredToken
+
+    timeout = float(os.getenv("JIRAHHH_TOKEN_COMMAND_TIMEOUT", "30"))
+    return DeferredToken(token_command, timeout=timeout)
 
 
 def get_jira_url(env: str, config: dict = None) -> str:
@@ -188,7 +587,7 @@ def get_jira_url(env: str, config: dict = None) -> str:
     """
     jira_url = os.getenv("JIRA_URL")
     if not jira_url and config:
-        jira_url = config.get(env, {}).get("url")
+        jira_url = _env_section(env, config).get("url")
 
     if not jira_url:
         raise ValueError(
@@ -214,7 +613,7 @@ def get_email(env: str, config: dict = None) -> str:
     """
     email = os.getenv("JIRA_EMAIL")
     if not email and config:
-        email = config.get(env, {}).get("email")
+        email = _env_section(env, config).get("email")
     return email
 
 
@@ -230,7 +629,7 @@ def get_proxy_url(env: str, config: dict = None) -> str:
         Proxy URL string or None if not configured
     """
     if config:
-        return config.get(env, {}).get("proxy")
+        return _env_section(env, config).get("proxy")
     return None
 
 
@@ -250,7 +649,7 @@ def get_custom_fields(env: str, config: dict = None) -> dict:
     """
     if config:
         # Per-environment custom fields take priority
-        env_fields = config.get(env, {}).get("custom_fields")
+        env_fields = _env_section(env, config).get("custom_fields")
         if env_fields:
             return env_fields
         # Fall back to global custom fields
@@ -277,7 +676,7 @@ def get_security_level(level_name: str, env: str = None, config: dict = None) ->
     if config:
         # Per-environment security levels take priority
         if env:
-            env_level = config.get(env, {}).get("security_levels", {}).get(level_name)
+            env_level = _env_section(env, config).get("security_levels", {}).get(level_name)
             if env_level:
                 return env_level
         # Fall back to global security levels
@@ -4,10 +4,21 @@ Functions for converting between formats.
 
 import sys
 import os
-import pypandoc
 from typing import Optional
 
 
+def _markdown_to_jira(markdown: str) -> str:
+    """
+    Convert GitHub-flavored Markdown text to Jira wiki markup with pandoc.
+
+    The text is piped to pandoc rather than passed as a file, so files read
+    by the caller aren't opened and read a second time.
+    """
+    import pypandoc
+
+    return pypandoc.convert_text(markdown, "jira", format="gfm+raw_attribute")
+
+
 def convert_to_jira(text: str, file_path: Optional[str] = None) -> str:
     """
     Convert text to Jira format, detecting if conversion is needed based on file extension.
@@ -27,8 +38,8 @@ def convert_to_jira(text: str, file_path: Optional[str] = None) -> str:
         ext = os.path.splitext(file_path)[1].lower()
 
         if ext == ".md":
-            # Convert from markdown to Jira
-            return pypandoc.convert_file(file_path, "jira", format="gfm+raw_attribute")
+            # Convert from markdown to Jira; the caller already read the file
+            return _markdown_to_jira(text)
         elif ext == ".txt" or ext == "":
             # Assume it's already in Jira format
             return text
@@ -37,13 +48,21 @@ def convert_to_jira(text: str, file_path: Optional[str] = None) -> str:
                 f"Unsupported file format: {ext}. Only .md and .txt are supported."
             )
 
-    # If text looks like a file path that exists, check it
-    if text and os.path.isfile(text):
+    # If text looks like a file path that exists, check it. Multi-line or
+    # very long text can't be a path, so skip the stat() for descriptions.
+    if (
+        text
+        and len(text) < 4096
+        and "\n" not in text
+        and "\0" not in text
+        and os.path.isfile(text)
+    ):
         ext = os.path.splitext(text)[1].lower()
 
         if ext == ".md":
-            # Convert from markdown to Jira
-            return pypandoc.convert_file(text, "jira", format="gfm+raw_attribute")
+            # Convert from markdown to Jira (read as UTF-8, as pandoc would)
+            with open(text, "r", encoding="utf-8") as f:
+                return _markdown_to_jira(f.read())
         elif ext == ".txt" or ext == "":
             # Read and return as-is
             with open(text, "r") as f:
@@ -77,8 +96,10 @@ def read_description(
         if file_path == "-":
             return sys.stdin.read()
         else:
-            # Use smart detection
-            with open(file_path, "r") as f:
+            # Use smart detection. Markdown is read as UTF-8 whatever the
+            # locale, matching how pandoc reads it.
+            encoding = "utf-8" if file_path.lower().endswith(".md") else None
+            with open(file_path, "r", encoding=encoding) as f:
                 content = f.read()
             return convert_to_jira(content, file_path)
     elif inline:
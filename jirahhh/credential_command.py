@@ -0,0 +1,77 @@
+"""
+Deferred API token lookup via an external command.
+"""
+
+import logging
+import shlex
+import subprocess
+
+logger = logging.getLogger(__name__)
+
+
+class DeferredToken:
+    """
+    API token produced by running a command, fetched on first use.
+
+    Lets the token live in a secret store (e.g. `gopass show -o jira/token`)
+    without unlocking it for commands that fail or exit before talking to Jira.
+    The command's output is cached, so it runs at most once per instance.
+    """
+
+    def __init__(self, command: str, timeout: float = 30):
+        """
+        Args:
+            command: Shell-style command line that prints the token to stdout
+            timeout: Seconds to wait for the command before giving up
+        """
+        self.command = command
+        self.timeout = timeout
+        self._token = None
+
+    def resolve(self) -> str:
+        """
+        Run the command (once) and return the token it printed.
+
+        Returns:
+            API token string, with surrounding whitespace stripped
+
+        Raises:
+            ValueError: If the command fails, times out, or prints nothing
+        """
+        if self._token is not None:
+            return self._token
+
+        logger.debug("Running token command: %s", self.command)
+        try:
+            result = subprocess.run(
+                shlex.split(self.command),
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            raise ValueError(
+                f"Token command timed out after {self.timeout}s: {self.command}"
+            )
+        except OSError as e:
+            raise ValueError(f"Token command could not be run: {e}")
+
+        if result.returncode != 0:
+            raise ValueError(
+                f"Token command exited with status {result.returncode}: "
+                f"{result.stderr.strip()}"
+            )
+
+        token = result.stdout.strip()
+        if not token:
+            raise ValueError(f"Token command produced no output: {self.command}")
+
+        self._token = token
+        return token
+
+    def __str__(self) -> str:
+        return self.resolve()
+
+    def __repr__(self) -> str:
+        # Never include the token itself
+        return f"DeferredToken({self.command!r})"
@@ -0,0 +1,105 @@
+"""
+Process-wide cache of DNS lookups for urllib3 connections.
+"""
+
+import logging
+import socket
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Resolved addresses: (host, port, family, type) -> (expiry monotonic time,
+# getaddrinfo results)
+_gai_cache = {}
+_gai_cache_lock = threading.Lock()
+_GAI_CACHE_TTL = 300
+
+_enabled = False
+
+# urllib3's create_connection, saved when the cache is installed
+_original_create_connection = None
+
+
+def getaddrinfo(host, port, family, type):
+    """socket.getaddrinfo, answered from the cache once it is enabled.
+
+    Successful lookups are kept for _GAI_CACHE_TTL seconds, so reconnects to
+    the same Jira host (new pooled connections, parallel requests) skip the
+    resolver. Failed lookups are not cached.
+    """
+    if not _enabled:
+        return socket.getaddrinfo(host, port, family, type)
+
+    key = (host, port, family, type)
+    now = time.monotonic()
+    with _gai_cache_lock:
+        cached = _gai_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    result = socket.getaddrinfo(host, port, family, type)
+    with _gai_cache_lock:
+        _gai_cache[key] = (now + _GAI_CACHE_TTL, result)
+    return result
+
+
+def create_connection(address, *args, **kwargs) -> socket.socket:
+    """
+    Connect to *address*, resolving it through the cache.
+
+    Drop-in replacement for urllib3.util.connection.create_connection. Each
+    resolved address is handed to urllib3's own create_connection in turn,
+    so timeouts, socket options and source addresses behave exactly as
+    before; urllib3 only re-resolves the numeric address, which never hits
+    the network.
+
+    Args:
+        address: (host, port) tuple
+        *args, **kwargs: Passed through to urllib3's create_connection
+
+    Returns:
+        Connected socket
+
+    Raises:
+        OSError: If every address fails
+    """
+    from urllib3.util.connection import allowed_gai_family
+
+    host, port = address
+    if host.startswith("["):
+        host = host.strip("[]")
+
+    # allowed_gai_family() is AF_INET when IPv4-only mode is enabled
+    err = None
+    for _af, _socktype, _proto, _canonname, sa in getaddrinfo(
+        host, port, allowed_gai_family(), socket.SOCK_STREAM
+    ):
+        try:
+            return _original_create_connection((sa[0], port), *args, **kwargs)
+        except OSError as e:
+            err = e
+
+    raise err or OSError("getaddrinfo returns an empty list")
+
+
+def enable():
+    """Turn the cache on and route urllib3's connections through it.
+
+    If Happy Eyeballs has already replaced urllib3's create_connection, it is
+    left in place: the racer resolves through getaddrinfo() above, so it
+    picks up the cache either way.
+    """
+    global _enabled, _original_create_connection
+    if _enabled:
+        return
+    import urllib3.util.connection
+
+    from . import happy_eyeballs
+
+    current = urllib3.util.connection.create_connection
+    if current is not happy_eyeballs.create_connection:
+        _original_create_connection = current
+        urllib3.util.connection.create_connection = create_connection
+    _enabled = True
+    logger.debug("Caching DNS lookups for %ss", _GAI_CACHE_TTL)
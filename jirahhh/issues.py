@@ -2,15 +2,23 @@
 Functions for creating and updating Jira issues.
 """
 
+import itertools
 import logging
-from typing import Optional
-from jira import JIRA
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterator, Optional
+
+from .client import get_max_concurrent_requests
+from .jsonutil import loads
+
+if TYPE_CHECKING:
+    from jira import JIRA
 
 logger = logging.getLogger(__name__)
 
 
-def create_issue(
-    jira: JIRA,
+def _issue_fields(
     project_key: str,
     summary: str,
     issue_type: str,
@@ -24,25 +32,12 @@ def create_issue(
     additional_fields: Optional[dict] = None,
 ) -> dict:
     """
-    Create a Jira issue with the given parameters.
+    Build the fields payload for a new issue.
 
-    Args:
-        jira: JIRA client instance
-        project_key: Project key (e.g., PROJ)
-        summary: Issue summary/title
-        issue_type: Issue type (e.g., Epic, Story, Task, Spike)
-        description: Issue description in Jira wiki markup
-        acceptance_criteria: Optional acceptance criteria
-        epic_name: Optional epic name (required for Epic issue type)
-        parent: Optional parent issue key (e.g., PROJ-123)
-        epic_link: Optional epic link (e.g., PROJ-456)
-        custom_field_ids: Optional dict mapping field names to custom field IDs
-                         Expected keys: acceptance_criteria, epic_name, parent_link, epic_link
-        security_level_id: Optional security level ID to set on the issue
-        additional_fields: Optional additional custom fields
+    Takes the same arguments as create_issue(), minus the client.
 
     Returns:
-        Dictionary with id, key, and self URL of created issue
+        Dictionary of Jira field IDs to values
     """
     # Default custom field IDs (can be overridden via custom_field_ids param or config)
     field_ids = custom_field_ids or {}
@@ -59,27 +54,127 @@ def create_issue(
         fields["security"] = {"id": security_level_id}
 
     # Add custom fields using configured IDs
-    if acceptance_criteria and "acceptance_criteria" in field_ids:
-        fields[field_ids["acceptance_criteria"]] = acceptance_criteria
-    if epic_name and "epic_name" in field_ids:
-        fields[field_ids["epic_name"]] = epic_name
-    if parent and "parent_link" in field_ids:
-        fields[field_ids["parent_link"]] = parent
-    if epic_link and "epic_link" in field_ids:
-        fields[field_ids["epic_link"]] = epic_link
+    if field_ids:
+        for name, value in (
+            ("acceptance_criteria", acceptance_criteria),
+            ("epic_name", epic_name),
+            ("parent_link", parent),
+            ("epic_link", epic_link),
+        ):
+            field_id = field_ids.get(name)
+            if value and field_id:
+                fields[field_id] = value
 
     # Add any additional fields (can override anything)
     if additional_fields:
         fields.update(additional_fields)
 
+    return fields
+
+
+def create_issue(
+    jira: "JIRA",
+    project_key: str,
+    summary: str,
+    issue_type: str,
+    description: str,
+    acceptance_criteria: Optional[str] = None,
+    epic_name: Optional[str] = None,
+    parent: Optional[str] = None,
+    epic_link: Optional[str] = None,
+    custom_field_ids: Optional[dict] = None,
+    security_level_id: Optional[str] = None,
+    additional_fields: Optional[dict] = None,
+) -> dict:
+    """
+    Create a Jira issue with the given parameters.
+
+    Args:
+        jira: JIRA client instance
+        project_key: Project key (e.g., PROJ)
+        summary: Issue summary/title
+        issue_type: Issue type (e.g., Epic, Story, Task, Spike)
+        description: Issue description in Jira wiki markup
+        acceptance_criteria: Optional acceptance criteria
+        epic_name: Optional epic name (required for Epic issue type)
+        parent: Optional parent issue key (e.g., PROJ-123)
+        epic_link: Optional epic link (e.g., PROJ-456)
+        custom_field_ids: Optional dict mapping field names to custom field IDs
+                         Expected keys: acceptance_criteria, epic_name, parent_link, epic_link
+        security_level_id: Optional security level ID to set on the issue
+        additional_fields: Optional additional custom fields
+
+    Returns:
+        Dictionary with id, key, and self URL of created issue
+    """
+    fields = _issue_fields(
+        project_key,
+        summary,
+        issue_type,
+        description,
+        acceptance_criteria=acceptance_criteria,
+        epic_name=epic_name,
+        parent=parent,
+        epic_link=epic_link,
+        custom_field_ids=custom_field_ids,
+        security_level_id=security_level_id,
+        additional_fields=additional_fields,
+    )
+
     # Create the issue
     new_issue = jira.create_issue(fields=fields)
 
     return {"id": new_issue.id, "key": new_issue.key, "self": new_issue.self}
 
 
+# Issues sent per request to Jira's bulk create endpoint, which rejects
+# larger batches
+_BULK_CREATE_BATCH_SIZE = 50
+
+
+def create_issues_bulk(jira: "JIRA", issues: list) -> list:
+    """
+    Create several Jira issues using the bulk create endpoint.
+
+    Issues are sent in batches of 50, with up to JIRAHHH_MAX_CONCURRENT_REQUESTS
+    batches in flight at once. A failing issue doesn't stop the others.
+
+    Args:
+        jira: JIRA client instance
+        issues: List of dicts of create_issue() keyword arguments (project_key,
+                summary, issue_type, description, ...), one per issue
+
+    Returns:
+        List with one entry per input issue, in order: a dictionary with id,
+        key, and self URL of the created issue, or {"error": ...} with Jira's
+        field errors if it was rejected
+    """
+    field_list = [_issue_fields(**issue) for issue in issues]
+    batches = [
+        field_list[i : i + _BULK_CREATE_BATCH_SIZE]
+        for i in range(0, len(field_list), _BULK_CREATE_BATCH_SIZE)
+    ]
+
+    def create_batch(batch):
+        return jira.create_issues(field_list=batch, prefetch=False)
+
+    results = []
+    with ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as executor:
+        for batch_results in executor.map(create_batch, batches):
+            for item in batch_results:
+                if item["status"] == "Success":
+                    new_issue = item["issue"]
+                    results.append(
+                        {"id": new_issue.id, "key": new_issue.key, "self": new_issue.self}
+                    )
+                else:
+                    results.append({"error": item["error"]})
+
+    return results
+
+
 def update_issue(
-    jira: JIRA,
+    jira: "JIRA",
     issue_key: str,
     summary: Optional[str] = None,
     description: Optional[str] = None,
@@ -122,8 +217,31 @@ def update_issue(
     return {"id": issue.id, "key": issue.key, "self": issue.self}
 
 
+# Fields always present in view_issue output
+_BASE_FIELDS = ("summary", "status", "issuetype", "description")
+
+# Optional fields in view_issue output: Jira field ID -> (output key,
+# extractor applied to the field's raw JSON value). Empty fields are skipped.
+_FIELD_EXTRACTORS = {
+    "assignee": ("assignee", lambda v: v["displayName"]),
+    "reporter": ("reporter", lambda v: v["displayName"]),
+    "priority": ("priority", lambda v: v["name"]),
+    "security": ("security", lambda v: {"id": v["id"], "name": v["name"]}),
+    "labels": ("labels", lambda v: v),
+    "components": ("components", lambda v: [c["name"] for c in v]),
+}
+
+# Configured custom fields in view_issue output: (custom_field_ids key, output key)
+_CUSTOM_FIELD_KEYS = (
+    ("acceptance_criteria", "acceptance_criteria"),
+    ("epic_name", "epic_name"),
+    ("parent_link", "parent"),
+    ("epic_link", "epic_link"),
+)
+
+
 def view_issue(
-    jira: JIRA,
+    jira: "JIRA",
     issue_key: str,
     fields: Optional[str] = None,
     custom_field_ids: Optional[dict] = None,
@@ -134,86 +252,219 @@ def view_issue(
     Args:
         jira: JIRA client instance
         issue_key: Issue key to view (e.g., PROJ-123)
-        fields: Optional comma-separated list of fields to retrieve (default: common fields)
+        fields: Optional comma-separated list of fields to retrieve (default: the
+                fields shown in the result, including configured custom fields)
         custom_field_ids: Optional dict mapping field names to custom field IDs for pretty-printing
 
     Returns:
         Dictionary with issue information
     """
-    # Get the issue
-    issue = jira.issue(issue_key, fields=fields if fields else "*all")
     field_ids = custom_field_ids or {}
 
+    # Only ask for the fields the result is built from, rather than "*all"
+    if not fields:
+        fields = ",".join(
+            [*_BASE_FIELDS, *_FIELD_EXTRACTORS]
+            + [field_ids[name] for name, _ in _CUSTOM_FIELD_KEYS if name in field_ids]
+        )
+
+    # Get the issue
+    issue = jira.issue(issue_key, fields=fields)
+
+    # Read the parsed JSON directly rather than through Resource attributes
+    raw = issue.raw.get("fields", {})
+    status = raw.get("status")
+    issuetype = raw.get("issuetype")
+
     # Extract common fields
     result = {
         "key": issue.key,
         "id": issue.id,
         "self": issue.self,
-        "summary": getattr(issue.fields, "summary", None),
-        "status": issue.fields.status.name if hasattr(issue.fields, "status") else None,
-        "type": (
-            issue.fields.issuetype.name if hasattr(issue.fields, "issuetype") else None
-        ),
-        "description": getattr(issue.fields, "description", "") or "",
+        "summary": raw.get("summary"),
+        "status": status.get("name") if status else None,
+        "type": issuetype.get("name") if issuetype else None,
+        "description": raw.get("description") or "",
     }
 
-    # Add assignee if present
-    if hasattr(issue.fields, "assignee") and issue.fields.assignee:
-        result["assignee"] = issue.fields.assignee.displayName
+    # Add optional fields if present
+    for field_id, (out_key, extract) in _FIELD_EXTRACTORS.items():
+        value = raw.get(field_id)
+        if value:
+            result[out_key] = extract(value)
 
-    # Add reporter if present
-    if hasattr(issue.fields, "reporter") and issue.fields.reporter:
-        result["reporter"] = issue.fields.reporter.displayName
+    # Add custom fields if field IDs are provided
+    for name, out_key in _CUSTOM_FIELD_KEYS:
+        if name in field_ids:
+            value = raw.get(field_ids[name])
+            if value:
+                result[out_key] = value
 
-    # Add priority if present
-    if hasattr(issue.fields, "priority") and issue.fields.priority:
-        result["priority"] = issue.fields.priority.name
+    return result
 
-    # Add security level if present
-    if hasattr(issue.fields, "security") and issue.fields.security:
-        result["security"] = {
-            "id": issue.fields.security.id,
-            "name": issue.fields.security.name,
-        }
 
-    # Add custom fields if field IDs are provided
-    if "acceptance_criteria" in field_ids and hasattr(
-        issue.fields, field_ids["acceptance_criteria"]
-    ):
-        acceptance_criteria = getattr(
-            issue.fields, field_ids["acceptance_criteria"], None
+def view_issues_bulk(
+    jira: "JIRA",
+    issue_keys: list,
+    fields: Optional[str] = None,
+    custom_field_ids: Optional[dict] = None,
+) -> list:
+    """
+    View several Jira issues, fetching up to JIRAHHH_MAX_CONCURRENT_REQUESTS at once.
+
+    Args:
+        jira: JIRA client instance
+        issue_keys: Issue keys to view (e.g., ["PROJ-123", "PROJ-124"])
+        fields: Optional comma-separated list of fields to retrieve (default: the
+                fields shown in the result, including configured custom fields)
+        custom_field_ids: Optional dict mapping field names to custom field IDs for pretty-printing
+
+    Returns:
+        List of issue dictionaries as returned by view_issue(), in the order
+        of issue_keys
+    """
+
+    def view(issue_key):
+        return view_issue(
+            jira, issue_key, fields=fields, custom_field_ids=custom_field_ids
         )
-        if acceptance_criteria:
-            result["acceptance_criteria"] = acceptance_criteria
 
-    if "epic_name" in field_ids and hasattr(issue.fields, field_ids["epic_name"]):
-        epic_name = getattr(issue.fields, field_ids["epic_name"], None)
-        if epic_name:
-            result["epic_name"] = epic_name
+    with ThreadPoolExecutor(max_workers=get_max_concurrent_requests()) as executor:
+        return list(executor.map(view, issue_keys))
 
-    if "parent_link" in field_ids and hasattr(issue.fields, field_ids["parent_link"]):
-        parent = getattr(issue.fields, field_ids["parent_link"], None)
-        if parent:
-            result["parent"] = parent
 
-    if "epic_link" in field_ids and hasattr(issue.fields, field_ids["epic_link"]):
-        epic_link = getattr(issue.fields, field_ids["epic_link"], None)
-        if epic_link:
-            result["epic_link"] = epic_link
+def _search_pages(jira: "JIRA", jql: str, fields: str, max_results: int) -> list:
+    """
+    Run a JQL search and return the raw JSON of the matching issues.
 
-    # Add labels if present
-    if hasattr(issue.fields, "labels") and issue.fields.labels:
-        result["labels"] = issue.fields.labels
+    The first page tells us the total and the page size the server allows;
+    the remaining pages are then requested concurrently (up to
+    JIRAHHH_MAX_CONCURRENT_REQUESTS at a time) rather than one after another.
 
-    # Add components if present
-    if hasattr(issue.fields, "components") and issue.fields.components:
-        result["components"] = [c.name for c in issue.fields.components]
+    Args:
+        jira: JIRA client instance
+        jql: JQL query string
+        fields: Comma-separated list of fields to retrieve
+        max_results: Maximum number of issues to return (0 for all)
 
-    return result
+    Returns:
+        List of issue dicts, in search order
+    """
+    # With no limit, ask for the largest page; the server caps it to its own
+    # maximum either way
+    first = jira.search_issues(
+        jql_str=jql, maxResults=max_results or 1000, fields=fields, json_result=True
+    )
+    issues = first.get("issues", [])
+
+    wanted = first.get("total", len(issues))
+    if max_results:
+        wanted = min(wanted, max_results)
+    page_size = len(issues)
+    if not page_size or page_size >= wanted:
+        return issues[:wanted]
+
+    def fetch_page(start_at):
+        page = jira.search_issues(
+            jql_str=jql,
+            startAt=start_at,
+            maxResults=min(page_size, wanted - start_at),
+            validate_query=False,
+            fields=fields,
+            json_result=True,
+        )
+        return page.get("issues", [])
+
+    workers = get_max_concurrent_requests()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() yields pages in offset order regardless of completion order
+        for page in executor.map(fetch_page, range(page_size, wanted, page_size)):
+            issues.extend(page)
+
+    return issues[:wanted]
+
+
+def _search_item(issue: dict) -> dict:
+    """Summarize one issue from a search response's raw JSON."""
+    raw = issue.get("fields", {})
+    item = {
+        "key": issue["key"],
+        "summary": raw.get("summary"),
+    }
+
+    # Add optional fields if present
+    if raw.get("status"):
+        item["status"] = raw["status"]["name"]
+    if raw.get("issuetype"):
+        item["type"] = raw["issuetype"]["name"]
+    if raw.get("assignee"):
+        item["assignee"] = raw["assignee"]["displayName"]
+    if raw.get("priority"):
+        item["priority"] = raw["priority"]["name"]
+
+    return item
+
+
+def iter_search_issues(
+    jira: "JIRA", jql: str, fields: Optional[str] = None, page_size: int = 100
+) -> Iterator[dict]:
+    """
+    Search for Jira issues using JQL, yielding results one page at a time.
+
+    Only one page of results is held in memory, and the next page is only
+    requested once the caller has consumed the current one, so callers can
+    stop early or process large result sets as they arrive.
+
+    Args:
+        jira: JIRA client instance
+        jql: JQL query string
+        fields: Optional comma-separated list of fields to retrieve (default: common fields)
+        page_size: Number of issues to request per page (default: 100)
+
+    Yields:
+        Dictionary for each matching issue, in the same form as search_issues()
+    """
+    fields = fields if fields else "summary,status,issuetype,assignee"
+
+    # Jira Cloud pages with nextPageToken cursors; Server/Data Center with
+    # startAt offsets. jira < 3.10 has no enhanced_search_issues and still
+    # pages Cloud by offset.
+    if jira._is_cloud and hasattr(jira, "enhanced_search_issues"):
+        next_page_token = None
+        while True:
+            page = jira.enhanced_search_issues(
+                jql_str=jql,
+                nextPageToken=next_page_token,
+                maxResults=page_size,
+                fields=fields,
+                json_result=True,
+            )
+            for issue in page.get("issues", []):
+                yield _search_item(issue)
+            next_page_token = page.get("nextPageToken")
+            if page.get("isLast") or not next_page_token:
+                return
+    else:
+        start_at = 0
+        while True:
+            page = jira.search_issues(
+                jql_str=jql,
+                startAt=start_at,
+                maxResults=page_size,
+                validate_query=start_at == 0,
+                fields=fields,
+                json_result=True,
+            )
+            issues = page.get("issues", [])
+            for issue in issues:
+                yield _search_item(issue)
+            start_at += len(issues)
+            if not issues or start_at >= page.get("total", 0):
+                return
 
 
 def search_issues(
-    jira: JIRA, jql: str, fields: Optional[str] = None, max_results: int = 50
+    jira: "JIRA", jql: str, fields: Optional[str] = None, max_results: int = 50
 ) -> dict:
     """
     Search for Jira issues using JQL.
@@ -227,37 +478,59 @@ def search_issues(
     Returns:
         Dictionary with search results
     """
-    # Execute JQL search
-    issues = jira.search_issues(
-        jql_str=jql,
-        maxResults=max_results,
-        fields=fields if fields else "summary,status,issuetype,assignee",
-    )
+    # Execute JQL search. Jira Cloud pages with opaque nextPageToken cursors,
+    # which can only be followed in order, so read those pages one by one.
+    if jira._is_cloud:
+        results = iter_search_issues(
+            jira, jql, fields=fields, page_size=min(max_results or 100, 100)
+        )
+        if max_results:
+            results = itertools.islice(results, max_results)
+        results = list(results)
+    else:
+        fields = fields if fields else "summary,status,issuetype,assignee"
+        results = [
+            _search_item(issue)
+            for issue in _search_pages(jira, jql, fields, max_results)
+        ]
 
-    results = []
-    for issue in issues:
-        item = {
-            "key": issue.key,
-            "summary": issue.fields.summary,
-        }
+    return {"total": len(results), "issues": results}
 
-        # Add optional fields if present
-        if hasattr(issue.fields, "status") and issue.fields.status:
-            item["status"] = issue.fields.status.name
-        if hasattr(issue.fields, "issuetype") and issue.fields.issuetype:
-            item["type"] = issue.fields.issuetype.name
-        if hasattr(issue.fields, "assignee") and issue.fields.assignee:
-            item["assignee"] = issue.fields.assignee.displayName
-        if hasattr(issue.fields, "priority") and issue.fields.priority:
-            item["priority"] = issue.fields.priority.name
 
-        results.append(item)
+# Field metadata fetched per client: client -> {request key: (fetched
+# monotonic time, response)}. Weak keys so entries go away with the client.
+_metadata_cache = weakref.WeakKeyDictionary()
+_METADATA_CACHE_TTL = 300
 
-    return {"total": len(results), "issues": results}
+
+def _cached_metadata(jira: "JIRA", key: tuple, fetch):
+    """
+    Return a field metadata response, reusing one fetched in the last 5 minutes.
+
+    Field definitions and create metadata change rarely, but are large
+    responses that scripts calling get_fields() in a loop would otherwise
+    download every time.
+
+    Args:
+        jira: JIRA client instance the response belongs to
+        key: Tuple identifying the request (e.g. ("fields",))
+        fetch: Zero-argument callable that makes the request
+
+    Returns:
+        The cached or freshly fetched response
+    """
+    entries = _metadata_cache.setdefault(jira, {})
+    cached = entries.get(key)
+    if cached and time.monotonic() - cached[0] < _METADATA_CACHE_TTL:
+        return cached[1]
+
+    value = fetch()
+    entries[key] = (time.monotonic(), value)
+    return value
 
 
 def get_fields(
-    jira: JIRA, project_key: Optional[str] = None, issue_type: Optional[str] = None
+    jira: "JIRA", project_key: Optional[str] = None, issue_type: Optional[str] = None
 ) -> dict:
     """
     Get available fields, optionally filtered by project and issue type.
@@ -271,17 +544,21 @@ def get_fields(
         Dictionary with field information
     """
     # Get all fields
-    all_fields = jira.fields()
+    all_fields = _cached_metadata(jira, ("fields",), jira.fields)
 
     # If project and issue type specified, get createmeta to see which fields are required/available
     available_fields = None
     if project_key:
         try:
             # Get create metadata for the project
-            meta = jira.createmeta(
-                projectKeys=project_key,
-                issuetypeNames=issue_type,
-                expand="projects.issuetypes.fields",
+            meta = _cached_metadata(
+                jira,
+                ("createmeta", project_key, issue_type),
+                lambda: jira.createmeta(
+                    projectKeys=project_key,
+                    issuetypeNames=issue_type,
+                    expand="projects.issuetypes.fields",
+                ),
             )
 
             if meta and "projects" in meta and len(meta["projects"]) > 0:
@@ -315,7 +592,7 @@ def get_fields(
 
 
 def add_comment(
-    jira: JIRA,
+    jira: "JIRA",
     issue_key: str,
     body: str,
 ) -> dict:
@@ -341,20 +618,28 @@ def add_comment(
     }
 
 
-def call_api(
-    jira: JIRA, method: str, endpoint: str, data: Optional[dict] = None
-) -> dict:
+def _send(
+    jira: "JIRA",
+    method: str,
+    endpoint: str,
+    data: Optional[dict] = None,
+    stream: bool = False,
+):
     """
-    Make a generic API call to Jira.
+    Send a request to a Jira API endpoint with the client's session.
 
     Args:
         jira: JIRA client instance
         method: HTTP method (GET, POST, PUT, DELETE)
         endpoint: API endpoint path (e.g., /rest/api/2/issue/PROJ-123/comment)
         data: Optional JSON data for POST/PUT requests
+        stream: Leave the response body unread, for incremental parsing
 
     Returns:
-        API response as dictionary
+        requests Response, after checking its status
+
+    Raises:
+        ValueError: If the HTTP method is not supported
     """
     method = method.upper()
 
@@ -365,25 +650,101 @@ def call_api(
     url = jira._options["server"] + endpoint
     logger.debug("Making %s request to %s", method, url)
 
+    if method not in ("GET", "POST", "PUT", "DELETE"):
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    kwargs = {"json": data} if method in ("POST", "PUT") else {}
+
     # Make the API call using the JIRA client's session
-    if method == "GET":
-        response = jira._session.get(url)
-    elif method == "POST":
-        response = jira._session.post(url, json=data)
-    elif method == "PUT":
-        response = jira._session.put(url, json=data)
-    elif method == "DELETE":
-        response = jira._session.delete(url)
+    if stream:
+        # jira's ResilientSession reads the body of every successful response
+        # (to detect a Jira login bug), so streaming has to go around it, and
+        # so around its retries, to the plain requests.Session underneath
+        import requests
+
+        response = requests.Session.request(
+            jira._session,
+            method,
+            url,
+            stream=True,
+            timeout=jira._session.timeout,
+            **kwargs,
+        )
     else:
-        raise ValueError(f"Unsupported HTTP method: {method}")
+        response = jira._session.request(method, url, **kwargs)
 
     logger.debug("Response status: %d", response.status_code)
 
     # Raise for HTTP errors
     response.raise_for_status()
+    return response
+
+
+def call_api(
+    jira: "JIRA", method: str, endpoint: str, data: Optional[dict] = None
+) -> dict:
+    """
+    Make a generic API call to Jira.
+
+    Args:
+        jira: JIRA client instance
+        method: HTTP method (GET, POST, PUT, DELETE)
+        endpoint: API endpoint path (e.g., /rest/api/2/issue/PROJ-123/comment)
+        data: Optional JSON data for POST/PUT requests
+
+    Returns:
+        API response as dictionary
+    """
+    response = _send(jira, method, endpoint, data)
 
     # Return JSON response if available, otherwise return status info
     try:
-        return response.json()
-    except Exception:
+        return loads(response.content)
+    except ValueError:
         return {"status_code": response.status_code, "text": response.text}
+
+
+def stream_api(
+    jira: "JIRA",
+    method: str,
+    endpoint: str,
+    data: Optional[dict] = None,
+    items_key: str = "issues",
+) -> Iterator:
+    """
+    Make a generic API call to Jira and yield the items of an array in the response.
+
+    With ijson installed, the body is parsed as it downloads, so items are
+    yielded before the transfer finishes and the whole response is never
+    held in memory at once; this suits large search responses. Streamed
+    requests bypass jira's automatic retries on 429/503. Without ijson, the
+    body is parsed in full first, as call_api() does.
+
+    Args:
+        jira: JIRA client instance
+        method: HTTP method (GET, POST, PUT, DELETE)
+        endpoint: API endpoint path (e.g., /rest/api/2/search?jql=project=PROJ)
+        data: Optional JSON data for POST/PUT requests
+        items_key: Dotted path to the array in the response (default: issues)
+
+    Yields:
+        Each element of the array, as parsed JSON
+    """
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+
+    response = _send(jira, method, endpoint, data, stream=ijson is not None)
+    try:
+        if ijson is not None:
+            # Let urllib3 undo any gzip/deflate encoding as it reads
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, f"{items_key}.item", use_float=True)
+            return
+
+        items = loads(response.content)
+        for key in items_key.split("."):
+            items = items.get(key) if isinstance(items, dict) else None
+        yield from items if isinstance(items, list) else ()
+    finally:
+        response.close()
@@ -0,0 +1,30 @@
+"""
+JSON parsing shared by the CLI and the API helpers.
+"""
+
+import json
+
+# orjson is optional; look for it once per process rather than on every call
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """
+    Parse JSON text or bytes, using orjson when it is installed.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If the document is not valid JSON (json.JSONDecodeError
+                    and orjson.JSONDecodeError are both ValueErrors)
+    """
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)